@@ -1,15 +1,88 @@
 import os
+import re
+import errno
 import shutil
 import logging
 import json
+import pickle
+import functools
+import sys
+import stat
+import ctypes
+import struct
 import argparse  # Import the argparse library for CLI functionality.
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster config.json parsing.
+except ImportError:
+    orjson = None
+
+try:
+    import liburing  # Optional: batches renames through io_uring on Linux (liburing 2026.3.30 on PyPI).
+except ImportError:
+    liburing = None
+
 # --- Configuration ---
+# No timestamp in the format: formatting asctime costs a localtime() and strftime()
+# per record. Thread/process details aren't shown either, so don't collect them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    format='%(levelname)s - %(message)s',
                     handlers=[logging.StreamHandler()])
 
+# Sorting rules are read from next to the script; the parsed form is cached beside them.
+CONFIG_PATH = Path(__file__).parent / 'config.json'
+# Part of the cache key; bump it when the cached layout changes so old caches are ignored.
+MAPPINGS_CACHE_VERSION = 2
+
+# Suffixes browsers and download tools give a file while it is still being
+# written; config.json's "in_progress_extensions" overrides them.
+DEFAULT_IN_PROGRESS_EXTENSIONS = ('.crdownload', '.part', '.tmp', '.download')
+
+# Moves handed to a worker thread per task.
+MOVE_CHUNK_SIZE = 512
+
+# Renames queued to io_uring per submission.
+IO_URING_QUEUE_DEPTH = 256
+
+# Directory listing buffer for getdents64(); 1 MiB holds tens of thousands of
+# entries, so even huge folders are read in a handful of syscalls.
+GETDENTS_BUFFER_SIZE = 1 << 20
+
+# struct linux_dirent64 header: d_ino, d_off, d_reclen, d_type; d_name follows.
+DIRENT64_HEADER = struct.Struct('=QqHB')
+
+# d_type values from <dirent.h>.
+DT_UNKNOWN = 0
+DT_DIR = 4
+DT_LNK = 10
+
+# inotify event masks and header from <sys/inotify.h>: wd, mask, cookie, len; name follows.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+INOTIFY_EVENT_HEADER = struct.Struct('=iIII')
+
+_libc = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        _libc = None
+
+# glibc (2.30+) exposes getdents64() directly; elsewhere the scan uses os.scandir().
+_getdents64 = getattr(_libc, 'getdents64', None)
+if _getdents64 is not None:
+    _getdents64.argtypes = (ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t)
+    _getdents64.restype = ctypes.c_ssize_t
+
 
 # --- Core Logic ---
 class FileOrganizer:
@@ -17,28 +90,67 @@ class FileOrganizer:
     Organizes files in a directory based on rules from an external config.json file.
     """
 
-    def __init__(self, target_directory):
+    def __init__(self, target_directory, use_io_uring=False, use_getdents=False, use_threads=False):
         """
         Initializes the FileOrganizer.
 
         Args:
             target_directory (str): The absolute path to the directory to be organized.
+            use_io_uring (bool): Queue renames through io_uring (Linux, requires the
+                optional liburing package). Off by default: on local disks a plain
+                rename loop is faster.
+            use_getdents (bool): List the directory with getdents64() and a 1 MiB
+                buffer (Linux with glibc 2.30+). Off by default: decoding the
+                records in Python is slower than os.scandir() on local disks.
+            use_threads (bool): Spread the renames over a thread pool, for network
+                filesystems where each rename is a round trip. Off by default: on
+                local disks the kernel serializes renames in one directory, so a
+                plain loop is faster.
         """
         self.target_directory = Path(target_directory)
+        if use_io_uring and (liburing is None or not sys.platform.startswith('linux')):
+            raise ValueError("Error: io_uring renames require Linux and the liburing package.")
+        self.use_io_uring = use_io_uring
+        if use_getdents and _getdents64 is None:
+            raise ValueError("Error: getdents64() listing requires Linux with glibc 2.30 or newer.")
+        self.use_getdents = use_getdents
+        self.use_threads = use_threads
         if not self.target_directory.is_dir():
             raise ValueError(f"Error: The specified path '{target_directory}' is not a valid directory.")
 
-        self.file_mappings = self._load_mappings()
+        # pathlib stays at the API boundary; the scan and the moves work on this
+        # pre-encoded form and build paths by plain concatenation.
+        self._encoded_target = os.fsencode(self.target_directory)
+        self.file_mappings, self.in_progress_extensions = self._load_mappings()
+        self._destinations, self._other_destination, self._category_dirs = self._build_destinations()
+        self._compound_pattern, self._compound_tails = self._build_compound_matcher()
         logging.info(f"FileOrganizer initialized for directory: {self.target_directory}")
 
     def _load_mappings(self):
         """
         Loads sorting rules from 'config.json' and inverts them for efficient lookup.
+
+        Returns:
+            tuple: The {extension: category} dict and the frozenset of
+                extensions marking a download that is still in progress.
         """
         try:
-            config_path = Path(__file__).parent / 'config.json'
-            with open(config_path, 'r') as f:
-                data = json.load(f)
+            config_path = CONFIG_PATH
+            cache_path = config_path.with_name(config_path.name + '.cache.pkl')
+            config_stat = config_path.stat()
+            # The cache is only trusted while config.json is unchanged.
+            cache_key = (MAPPINGS_CACHE_VERSION, config_stat.st_mtime_ns, config_stat.st_size)
+
+            rules = self._read_mappings_cache(cache_path, cache_key)
+            if rules is not None:
+                logging.info("Loaded sorting rules from the 'config.json' cache.")
+                return rules
+
+            with open(config_path, 'rb') as f:
+                raw_config = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+            # handler below covers both parsers.
+            data = orjson.loads(raw_config) if orjson is not None else json.loads(raw_config)
 
             mappings = data.get("file_mappings", {})
             extension_to_category = {
@@ -46,8 +158,11 @@ class FileOrganizer:
                 for category, extensions in mappings.items()
                 for ext in extensions
             }
+            in_progress = data.get("in_progress_extensions", DEFAULT_IN_PROGRESS_EXTENSIONS)
+            rules = (extension_to_category, frozenset(ext.lower() for ext in in_progress))
+            self._write_mappings_cache(cache_path, cache_key, rules)
             logging.info("Successfully loaded and processed 'config.json'.")
-            return extension_to_category
+            return rules
         except FileNotFoundError:
             logging.error("FATAL: 'config.json' not found. Ensure it exists in the same directory as the script.")
             raise
@@ -55,44 +170,619 @@ class FileOrganizer:
             logging.error("FATAL: 'config.json' is malformed. Please check its syntax.")
             raise
 
-    def organize_files(self):
+    @staticmethod
+    def _read_mappings_cache(cache_path, cache_key):
         """
-        Executes the file organization process using the loaded mappings.
+        Returns the cached sorting rules, or None if the cache is missing or stale.
         """
-        logging.info("Starting file organization process...")
-        files_moved = 0
-        files_skipped = 0
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, rules = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+        return rules if cached_key == cache_key else None
 
-        for source_path in self.target_directory.iterdir():
-            if source_path.is_dir():
-                continue
+    @staticmethod
+    def _write_mappings_cache(cache_path, cache_key, rules):
+        """
+        Saves the parsed sorting rules next to config.json so later runs can skip the JSON parse.
 
-            file_extension = source_path.suffix.lower()
+        The cache is written to a temporary file and renamed into place, so a
+        concurrent run never reads a half-written file. Failing to write it
+        (e.g. a read-only install) is not an error.
+        """
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump((cache_key, rules), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logging.debug(f"Could not write the 'config.json' cache: {e}")
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
 
-            if not file_extension:
-                logging.warning(f"Skipping file without extension: {source_path.name}")
-                files_skipped += 1
-                continue
+    @staticmethod
+    def _ensure_directory(path):
+        """
+        Creates a single-level folder, leaving an existing one alone.
 
-            destination_folder_name = self.file_mappings.get(file_extension, 'Other')
-            destination_path = self.target_directory / destination_folder_name
+        Unlike os.makedirs(exist_ok=True) this is one mkdir() syscall, with no
+        follow-up isdir() check; category folders always sit directly inside the
+        already-validated target directory.
+        """
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
 
-            destination_path.mkdir(exist_ok=True)
+    @staticmethod
+    def _describe_error(error):
+        """
+        Formats an OSError for the user, decoding the bytes paths it may carry.
+        """
+        message = error.strerror or str(error)
+        if error.filename is not None:
+            message += f": {os.fsdecode(error.filename)}"
+            if error.filename2 is not None:
+                message += f" -> {os.fsdecode(error.filename2)}"
+        return message
 
-            destination_file_path = destination_path / source_path.name
+    @staticmethod
+    def _move_file(source, destination):
+        """
+        Moves a single file, preferring a plain rename.
 
+        Category folders live inside the target directory, so a rename is almost
+        always enough; shutil.move is kept for the rare case where one of them is
+        a mount point on another device.
+        """
+        try:
+            os.rename(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(os.fsdecode(source), os.fsdecode(destination))
+
+    def _move_chunk(self, category_moves):
+        """
+        Moves a run of planned (name, source, destination) files one after another.
+
+        Returns:
+            list: A (name, error) pair per file; error is None on success.
+        """
+        results = []
+        for name, source, destination in category_moves:
             try:
-                shutil.move(str(source_path), str(destination_file_path))
-                logging.info(f"Moved: {source_path.name} -> {destination_folder_name}/")
-                files_moved += 1
-            except Exception as e:
-                logging.error(f"Failed to move {source_path.name}. Error: {e}")
+                self._move_file(source, destination)
+                results.append((name, None))
+            except OSError as e:
+                results.append((name, e))
+        return results
+
+    def _move_serially(self, plan):
+        """
+        Moves the planned files one after another, yielding (name, category, error) for each.
+        """
+        for destination_folder_name, category_moves in plan.items():
+            for name, error in self._move_chunk(category_moves):
+                yield name, destination_folder_name, error
+
+    def _move_with_threads(self, plan):
+        """
+        Moves the planned files on a thread pool, yielding (name, category, error) as each one finishes.
+
+        Every rename touches the same source directory, so the kernel serializes
+        them on its lock and a Future per file would be pure overhead. Work is
+        handed out in chunks of MOVE_CHUNK_SIZE moves from one category instead,
+        and a plan that fits in a single chunk is moved serially without a pool.
+        """
+        chunks = [
+            (destination_folder_name, category_moves[start:start + MOVE_CHUNK_SIZE])
+            for destination_folder_name, category_moves in plan.items()
+            for start in range(0, len(category_moves), MOVE_CHUNK_SIZE)
+        ]
+        if len(chunks) <= 1:
+            yield from self._move_serially(plan)
+            return
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(chunks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._move_chunk, chunk): destination_folder_name
+                for destination_folder_name, chunk in chunks
+            }
+            for future in as_completed(futures):
+                destination_folder_name = futures[future]
+                for name, error in future.result():
+                    yield name, destination_folder_name, error
+
+    @staticmethod
+    def _open_io_uring():
+        """
+        Sets up an io_uring instance for batched renames.
+
+        Returns:
+            The ring, or None when the kernel refuses to create one (e.g. io_uring
+            disabled by sysctl or a container's seccomp profile).
+        """
+        ring = liburing.Ring()
+        try:
+            liburing.io_uring_queue_init(IO_URING_QUEUE_DEPTH, ring)
+        except OSError as e:
+            logging.warning(f"io_uring is unavailable, falling back to plain renames: {e}")
+            return None
+        return ring
+
+    def _move_with_io_uring(self, ring, plan):
+        """
+        Moves the planned files through io_uring, yielding (name, category, error) as each one finishes.
+
+        Each category's moves are queued up to IO_URING_QUEUE_DEPTH at a time
+        and submitted with a single syscall. A rename the ring can't complete is
+        retried with _move_file, which also covers the cross-device case. If the
+        kernel doesn't support IORING_OP_RENAMEAT (before Linux 5.11), the
+        remaining moves fall back to plain renames.
+
+        Written against liburing 2026.3.30, whose io_uring_prep_rename() takes
+        str paths only and which raises a failed rename's OSError when the
+        completion's res is read.
+        """
+        completion = liburing.Cqe()
+        renameat_supported = True
+        categories = list(plan.items())
+        try:
+            for position, (destination_folder_name, category_moves) in enumerate(categories):
+                for start in range(0, len(category_moves), IO_URING_QUEUE_DEPTH):
+                    if not renameat_supported:
+                        remaining = {destination_folder_name: category_moves[start:], **dict(categories[position + 1:])}
+                        yield from self._move_serially(remaining)
+                        return
+
+                    # The binding encodes str paths as strict UTF-8, so names
+                    # that aren't valid UTF-8 are renamed directly instead.
+                    queued = []
+                    undecodable = []
+                    for move in category_moves[start:start + IO_URING_QUEUE_DEPTH]:
+                        _, source, destination = move
+                        try:
+                            # The ring reads the path buffers only once the kernel
+                            # picks the request up, so the strings must outlive
+                            # the whole batch.
+                            queued.append((move, source.decode(), destination.decode()))
+                        except UnicodeDecodeError:
+                            undecodable.append(move)
+                    for name, error in self._move_chunk(undecodable):
+                        yield name, destination_folder_name, error
+                    if not queued:
+                        continue
+
+                    for index, (_, source, destination) in enumerate(queued):
+                        sqe = liburing.io_uring_get_sqe(ring)
+                        liburing.io_uring_prep_rename(sqe, source, destination)
+                        sqe.user_data = index
+                    liburing.io_uring_submit(ring)
+
+                    for _ in queued:
+                        liburing.io_uring_wait_cqe(ring, completion)
+                        cqe = completion[0]
+                        name, source, destination = queued[cqe.user_data][0]
+                        error = None
+                        try:
+                            # A failed rename raises when res is read, so anything
+                            # that reads back is a success (0).
+                            if cqe.res != 0:
+                                raise OSError(errno.EIO, "Unexpected io_uring completion result.")
+                        except OSError as e:
+                            if e.errno == errno.EINVAL:
+                                renameat_supported = False
+                            try:
+                                self._move_file(source, destination)
+                            except OSError as retry_error:
+                                error = retry_error
+                        finally:
+                            liburing.io_uring_cqe_seen(ring, cqe)
+                        yield name, destination_folder_name, error
+        finally:
+            liburing.io_uring_queue_exit(ring)
+
+    def _build_destinations(self):
+        """
+        Resolves every known extension to its destination folder up front.
+
+        The scan works on bytes paths (see organize_files), so the table is keyed
+        by encoded extension and each value pairs the category name with the
+        encoded folder path, trailing separator included. A file's destination
+        is then one dict lookup plus one concatenation.
+
+        Returns:
+            tuple: The extension table, the (category, path) pair for 'Other',
+                and the same pairs keyed by category name.
+        """
+        separator = os.fsencode(os.sep)
+        prefix = self._encoded_target + separator
+        category_dirs = {
+            category: (category, prefix + os.fsencode(category) + separator)
+            for category in {*self.file_mappings.values(), 'Other'}
+        }
+        destinations = {
+            os.fsencode(ext): category_dirs[category]
+            for ext, category in self.file_mappings.items()
+        }
+        # A download that is still being written has no category yet; the scan
+        # sets these files aside, and watch() waits for the rename to the final name.
+        for ext in self.in_progress_extensions:
+            destinations[os.fsencode(ext)] = (None, b'')
+        return destinations, category_dirs['Other'], category_dirs
+
+    def _build_compound_matcher(self):
+        """
+        Compiles the configured multi-part extensions (e.g. '.tar.gz') into one regex.
+
+        Splitting on the last dot alone would file 'backup.tar.gz' under '.gz'.
+        Running a regex over every name would slow the scan down, so it is only
+        consulted for names whose last part ends a compound extension ('gz' here).
+
+        Returns:
+            tuple: The compiled pattern (None when no compound extensions are
+                configured) and the set of lowercase bytes suffixes that trigger it.
+        """
+        compound = [ext for ext in self.file_mappings if ext.count('.') > 1]
+        if not compound:
+            return None, frozenset()
+        # The leading '.' keeps names with nothing before the extension (e.g.
+        # '.tar.gz') out, matching how single extensions are treated.
+        alternatives = b'|'.join(re.escape(os.fsencode(ext)) for ext in compound)
+        pattern = re.compile(rb'.(' + alternatives + rb')\Z', re.IGNORECASE | re.DOTALL)
+        tails = frozenset(os.fsencode(ext.rpartition('.')[2]) for ext in compound)
+        return pattern, tails
+
+    def _category_folder(self, category):
+        """
+        Returns the encoded path of a category's folder, for creating it.
+        """
+        # The table's paths end in a separator, ready for a name to be appended.
+        return self._category_dirs[category][1][:-len(os.sep)]
+
+    def _scan_with_scandir(self):
+        """
+        Yields (name, path) bytes pairs for every non-folder entry in the target directory.
+
+        Folders, and symlinks pointing at folders, are left out; symlinks to
+        files are yielded and get moved as links.
+        """
+        # os.scandir() reports each entry's type straight from the directory
+        # listing, so skipping sub-folders costs no extra stat() call per entry.
+        # Scanning a bytes path yields bytes names and paths, which os.rename
+        # takes as-is instead of re-encoding two strings on every call.
+        with os.scandir(self._encoded_target) as entries:
+            for entry in entries:
+                # Only symlinks need a stat() to find out what they point to.
+                if entry.is_dir(follow_symlinks=False) or (entry.is_symlink() and entry.is_dir()):
+                    continue
+                yield entry.name, entry.path
+
+    def _scan_with_getdents(self):
+        """
+        Same as _scan_with_scandir, but reads the directory with getdents64() and a 1 MiB buffer.
+
+        os.scandir() reads the listing a few KiB at a time, which means thousands
+        of syscalls for folders with hundreds of thousands of entries. Each
+        linux_dirent64 record carries d_type, so a stat() is only needed for
+        symlinks and on filesystems that report DT_UNKNOWN. Decoding the records
+        in Python costs more than the saved syscalls on local disks, so this is
+        only used when asked for (use_getdents), e.g. for network filesystems
+        where each listing round trip is expensive.
+        """
+        prefix = self._encoded_target + os.fsencode(os.sep)
+        unpack_header = DIRENT64_HEADER.unpack_from
+        header_size = DIRENT64_HEADER.size
+        buffer = ctypes.create_string_buffer(GETDENTS_BUFFER_SIZE)
+        fd = os.open(self._encoded_target, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            while True:
+                size = _getdents64(fd, buffer, GETDENTS_BUFFER_SIZE)
+                if size == 0:
+                    return
+                if size < 0:
+                    error = ctypes.get_errno()
+                    raise OSError(error, os.strerror(error), os.fsdecode(self._encoded_target))
+
+                data = ctypes.string_at(buffer, size)
+                offset = 0
+                while offset < size:
+                    _, _, record_length, entry_type = unpack_header(data, offset)
+                    name_start = offset + header_size
+                    name = data[name_start:data.index(b'\0', name_start)]
+                    offset += record_length
+
+                    if name == b'.' or name == b'..' or entry_type == DT_DIR:
+                        continue
+                    path = prefix + name
+                    if entry_type == DT_UNKNOWN:
+                        try:
+                            mode = os.lstat(path).st_mode
+                        except FileNotFoundError:
+                            continue
+                        if stat.S_ISDIR(mode):
+                            continue
+                        entry_type = DT_LNK if stat.S_ISLNK(mode) else entry_type
+                    if entry_type == DT_LNK and os.path.isdir(path):
+                        continue
+                    yield name, path
+        finally:
+            os.close(fd)
+
+    def _resolve_destination(self, suffix):
+        """
+        Returns the destination for a raw bytes suffix, e.g. b'JPG'.
+
+        Returns:
+            tuple: The category name, its encoded folder path, and whether names
+                with this suffix could carry a compound extension.
+        """
+        suffix = suffix.lower()
+        category, destination_dir = self._destinations.get(b'.' + suffix, self._other_destination)
+        return category, destination_dir, suffix in self._compound_tails
+
+    def _match_compound(self, name):
+        """
+        Looks a name up against the configured compound extensions (e.g. '.tar.gz').
+
+        Only worth calling when _resolve_destination() flagged the name's last
+        suffix as the tail of a compound extension.
+
+        Args:
+            name (bytes): The file name.
+
+        Returns:
+            tuple: The category name and encoded destination folder for the
+                compound extension, or None if the name doesn't end in one.
+        """
+        match = self._compound_pattern.search(name)
+        if match:
+            return self._destinations[match.group(1).lower()]
+        return None
+
+    def _destination_for(self, name):
+        """
+        Works out where a single file should go.
+
+        Args:
+            name (bytes): The file name, relative to the target directory.
+
+        Returns:
+            tuple: The category name and the encoded destination path, or None
+                if the file has no extension. The category is None for a
+                download that is still in progress.
+        """
+        head, _, suffix = name.rpartition(b'.')
+        if not (head and suffix):
+            return None
+        category, destination_dir, may_be_compound = self._resolve_destination(suffix)
+        if may_be_compound:
+            category, destination_dir = self._match_compound(name) or (category, destination_dir)
+        return category, destination_dir + name
+
+    def plan_moves(self):
+        """
+        Scans the target directory and works out where each file should go, without touching anything.
+
+        Returns:
+            tuple: The plan, mapping each category name to a list of
+                (name, source, destination) bytes triples in scan order, and the
+                number of files skipped for having no extension or for still
+                being downloaded.
+        """
+        plan = {}
+        files_skipped = 0
+        # Memoize on the raw suffix as it appears in the name (e.g. b'JPG'), so
+        # lowercasing it and building the b'.jpg' key happens once per distinct
+        # spelling. The cache is local to this scan, so it never holds on to self.
+        resolve_destination = functools.lru_cache(maxsize=None)(self._resolve_destination)
+        # Files tend to arrive in runs of the same type (a camera import, a batch
+        # of PDFs), so remember the last suffix resolved and skip even the cache
+        # lookup while it repeats.
+        last_suffix = None
+        may_be_compound = False
+        destination_dir = None
+        category_moves = None
+
+        scan = self._scan_with_getdents if self.use_getdents else self._scan_with_scandir
+        for name, source in scan():
+            # A single rpartition() is cheaper than building a Path for its
+            # .suffix. As with Path.suffix, a name with nothing before or after
+            # its last dot ('.bashrc', 'notes.') has no extension.
+            head, _, suffix = name.rpartition(b'.')
+
+            if not (head and suffix):
+                logging.warning(f"Skipping file without extension: {os.fsdecode(name)}")
                 files_skipped += 1
+                continue
+
+            if suffix != last_suffix:
+                last_suffix = suffix
+                destination_folder_name, destination_dir, may_be_compound = resolve_destination(suffix)
+                category_moves = plan.setdefault(destination_folder_name, [])
+
+            if may_be_compound:
+                compound = self._match_compound(name)
+                if compound:
+                    compound_folder_name, compound_dir = compound
+                    plan.setdefault(compound_folder_name, []).append((name, source, compound_dir + name))
+                    continue
+
+            category_moves.append((name, source, destination_dir + name))
+
+        # Downloads still in progress were collected under None rather than
+        # checked for on every file; leave them for their final rename.
+        in_progress = plan.pop(None, ())
+        if in_progress:
+            logging.info(f"Leaving {len(in_progress)} download(s) in progress alone: "
+                         + ", ".join(os.fsdecode(name) for name, _, _ in in_progress))
+            files_skipped += len(in_progress)
+
+        return plan, files_skipped
+
+    def organize_files(self, dry_run=False):
+        """
+        Executes the file organization process using the loaded mappings.
+
+        Args:
+            dry_run (bool): If True, only log the planned moves and leave the directory untouched.
+        """
+        logging.info("Starting file organization process...")
+        plan, files_skipped = self.plan_moves()
+
+        if dry_run:
+            for destination_folder_name, category_moves in plan.items():
+                logging.info(f"{destination_folder_name}/ ({len(category_moves)} files)")
+                for name, _, _ in category_moves:
+                    logging.info(f"  Would move: {os.fsdecode(name)}")
+            logging.info("--- Dry Run Complete ---")
+            logging.info(f"Files that would be moved: {sum(map(len, plan.values()))}")
+            logging.info(f"Files that would be skipped: {files_skipped}")
+            return
+
+        # Create every category folder in one pass before any file is moved.
+        for destination_folder_name in plan:
+            self._ensure_directory(self._category_folder(destination_folder_name))
+
+        files_moved = Counter()
+        conflicts = []
+        failures = []
+        # Per-file lines are DEBUG only; check once so the loop doesn't build
+        # log messages that would be thrown away.
+        log_each_move = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        # The plan is handed over as-is: each category's moves stay together, so
+        # its folder stays hot in the kernel's dentry cache while its files are
+        # renamed into it, and no per-file tuples are rebuilt to flatten it.
+        ring = self._open_io_uring() if plan and self.use_io_uring else None
+        if ring is not None:
+            results = self._move_with_io_uring(ring, plan)
+        elif self.use_threads:
+            results = self._move_with_threads(plan)
+        else:
+            results = self._move_serially(plan)
+
+        for name, destination_folder_name, error in results:
+            if error is None:
+                if log_each_move:
+                    logging.debug(f"Moved: {os.fsdecode(name)} -> {destination_folder_name}/")
+                files_moved[destination_folder_name] += 1
+                continue
+
+            files_skipped += 1
+            if error.errno == errno.EEXIST:
+                conflicts.append(os.fsdecode(name))
+            else:
+                failures.append((os.fsdecode(name), error))
+
+        # Report problems in one block each rather than one log record per file.
+        if conflicts:
+            logging.warning(f"{len(conflicts)} file(s) already exist in their destination folder and were left in place: "
+                            + ", ".join(conflicts))
+        if failures:
+            logging.error(f"Failed to move {len(failures)} file(s):\n"
+                          + "\n".join(f"  {name}: {self._describe_error(error)}" for name, error in failures))
 
         logging.info("--- Organization Complete ---")
-        logging.info(f"Total files moved: {files_moved}")
+        logging.info(f"Total files moved: {sum(files_moved.values())}")
+        if files_moved:
+            breakdown = ", ".join(f"{category}: {count}" for category, count in files_moved.most_common())
+            logging.info(f"Moved by category: {breakdown}")
         logging.info(f"Total files skipped: {files_skipped}")
 
+    @staticmethod
+    def _parse_inotify_events(data):
+        """
+        Splits a buffer read from an inotify descriptor into its events.
+
+        Yields:
+            tuple: The event mask and the file name (bytes, empty for events
+                about the watched directory itself).
+        """
+        offset = 0
+        while offset < len(data):
+            _, mask, _, name_length = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+            name_start = offset + INOTIFY_EVENT_HEADER.size
+            # The kernel pads the name with NULs to keep the next event aligned.
+            yield mask, data[name_start:name_start + name_length].rstrip(b'\0')
+            offset = name_start + name_length
+
+    def watch(self):
+        """
+        Organizes the directory, then keeps running and files new arrivals as they appear.
+
+        Uses inotify (Linux only) to be told about files that finish being
+        written (IN_CLOSE_WRITE) or are moved in (IN_MOVED_TO, e.g. a browser
+        renaming a finished download), so each new file is handled on its own
+        instead of rescanning the whole directory. Files with an in-progress
+        suffix (e.g. '.crdownload') are left alone until they are renamed to
+        their final name. Runs until the directory goes away or interrupted.
+        """
+        if _libc is None or not hasattr(_libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, "Watch mode requires Linux inotify.")
+
+        fd = _libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        try:
+            if _libc.inotify_add_watch(fd, self._encoded_target, IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+                error = ctypes.get_errno()
+                raise OSError(error, os.strerror(error), str(self.target_directory))
+
+            # Catch up on whatever is already there; the watch is registered
+            # first so nothing arriving during this pass is missed.
+            self.organize_files()
+            logging.info(f"Watching {self.target_directory} for new files. Press Ctrl+C to stop.")
+
+            separator = os.fsencode(os.sep)
+            while True:
+                for mask, name in self._parse_inotify_events(os.read(fd, 64 * 1024)):
+                    if mask & IN_IGNORED:
+                        logging.error(f"Stopped watching: {self.target_directory} was removed or unmounted.")
+                        return
+                    if mask & IN_Q_OVERFLOW:
+                        logging.warning("Missed some file events; rescanning the directory.")
+                        self.organize_files()
+                        continue
+                    if mask & IN_ISDIR or not name:
+                        continue
+
+                    source = self._encoded_target + separator + name
+                    if os.path.islink(source) and os.path.isdir(source):
+                        continue
+                    destination = self._destination_for(name)
+                    if destination is None:
+                        logging.warning(f"Skipping file without extension: {os.fsdecode(name)}")
+                        continue
+
+                    destination_folder_name, destination_path = destination
+                    if destination_folder_name is None:
+                        logging.debug(f"Waiting for download to finish: {os.fsdecode(name)}")
+                        continue
+                    try:
+                        # Not remembered between events: the user may delete a
+                        # category folder while the watch is running.
+                        self._ensure_directory(self._category_folder(destination_folder_name))
+                        self._move_file(source, destination_path)
+                        logging.info(f"Moved: {os.fsdecode(name)} -> {destination_folder_name}/")
+                    except FileNotFoundError as e:
+                        if os.path.lexists(source):
+                            logging.error(f"Failed to move {os.fsdecode(name)}. Error: {self._describe_error(e)}")
+                        else:
+                            # Already moved by the startup pass, or gone again
+                            # before we got to it; nothing to do.
+                            logging.debug(f"Skipping vanished file: {os.fsdecode(name)}")
+                    except OSError as e:
+                        logging.error(f"Failed to move {os.fsdecode(name)}. Error: {self._describe_error(e)}")
+        finally:
+            os.close(fd)
+
 
 # --- Execution Block ---
 # This block is now a command-line interface handler.
@@ -109,16 +799,49 @@ if __name__ == "__main__":
         type=str,
         help="The target directory to organize."
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show where each file would be moved without changing anything."
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and organize new files as they arrive (Linux only)."
+    )
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="Rename files on a thread pool (can help on network filesystems)."
+    )
+    parser.add_argument(
+        "--io-uring",
+        action="store_true",
+        help="Batch renames through io_uring (Linux only, requires liburing)."
+    )
+    parser.add_argument(
+        "--getdents",
+        action="store_true",
+        help="List the directory with large getdents64() reads (Linux only)."
+    )
 
     # 3. Parse the arguments provided by the user.
     args = parser.parse_args()
+    if args.watch and args.dry_run:
+        parser.error("--watch cannot be combined with --dry-run.")
 
     # 4. Use the parsed directory.
     directory_to_organize = args.directory
 
     try:
-        organizer = FileOrganizer(directory_to_organize)
-        organizer.organize_files()
+        organizer = FileOrganizer(directory_to_organize, use_io_uring=args.io_uring,
+                                  use_getdents=args.getdents, use_threads=args.threads)
+        if args.watch:
+            organizer.watch()
+        else:
+            organizer.organize_files(dry_run=args.dry_run)
+    except KeyboardInterrupt:
+        logging.info("Stopped.")
     except (ValueError, FileNotFoundError) as e:
         logging.error(e)
     except Exception as e:
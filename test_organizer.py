@@ -0,0 +1,459 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import organizer
+from organizer import FileOrganizer
+
+
+class OrganizerTestCase(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.target = Path(temp_dir.name) / "target"
+        self.target.mkdir()
+        # Work on a copy of config.json so its cache is written here rather
+        # than next to the source.
+        self.config_path = Path(temp_dir.name) / "config.json"
+        shutil.copyfile(organizer.CONFIG_PATH, self.config_path)
+        patcher = mock.patch.object(organizer, "CONFIG_PATH", self.config_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache_path = self.config_path.with_name("config.json.cache.pkl")
+
+
+class MappingsCacheTests(OrganizerTestCase):
+    def _load(self):
+        with self.assertLogs(level="INFO") as logs:
+            file_organizer = FileOrganizer(self.target)
+        from_cache = any("from the 'config.json' cache" in line for line in logs.output)
+        return file_organizer.file_mappings, from_cache
+
+    def test_second_run_uses_cache(self):
+        mappings, from_cache = self._load()
+        self.assertFalse(from_cache)
+        self.assertTrue(self.cache_path.exists())
+
+        self.assertEqual(self._load(), (mappings, True))
+
+    def test_size_change_invalidates_cache(self):
+        self._load()
+        self.config_path.write_text('{"file_mappings": {"Pictures": [".JPG"]}}')
+
+        self.assertEqual(self._load(), ({".jpg": "Pictures"}, False))
+
+    def test_mtime_change_invalidates_cache(self):
+        self._load()
+        config = self.config_path.read_text()
+        self.config_path.write_text(config.replace('"Images"', '"Photos"'))
+        config_stat = self.config_path.stat()
+        # Same size; make sure the edit also lands on a different timestamp.
+        os.utime(self.config_path, ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns + 1_000_000_000))
+
+        mappings, from_cache = self._load()
+        self.assertFalse(from_cache)
+        self.assertEqual(mappings[".jpg"], "Photos")
+
+    def test_corrupt_cache_is_rebuilt(self):
+        mappings, _ = self._load()
+        self.cache_path.write_bytes(b"not a pickle")
+
+        self.assertEqual(self._load(), (mappings, False))
+        self.assertEqual(self._load(), (mappings, True))
+
+
+@unittest.skipIf(organizer._getdents64 is None, "getdents64() is only available on Linux with glibc 2.30+")
+class GetdentsScanTests(OrganizerTestCase):
+    def test_matches_scandir(self):
+        for i in range(100):
+            (self.target / f"file{i}.jpg").touch()
+        (self.target / "noext").touch()
+        (self.target / ".hidden").touch()
+        (self.target / "folder").mkdir()
+        (self.target / "folder.jpg").mkdir()
+        (self.target / "dir_link.jpg").symlink_to("folder")
+        (self.target / "file_link.pdf").symlink_to("file0.jpg")
+        (self.target / "dangling.png").symlink_to("missing")
+
+        file_organizer = FileOrganizer(self.target, use_getdents=True)
+        # A small buffer forces several getdents64() calls.
+        with mock.patch.object(organizer, "GETDENTS_BUFFER_SIZE", 1024):
+            scanned = sorted(file_organizer._scan_with_getdents())
+
+        self.assertEqual(scanned, sorted(file_organizer._scan_with_scandir()))
+        names = {name for name, _ in scanned}
+        self.assertLessEqual({b"noext", b".hidden", b"file_link.pdf", b"dangling.png"}, names)
+        self.assertFalse(names & {b"folder", b"folder.jpg", b"dir_link.jpg"})
+        self.assertEqual(len(names), 104)
+        self.assertEqual(dict(scanned)[b"noext"], os.fsencode(self.target / "noext"))
+
+
+class OrganizeFilesTests(OrganizerTestCase):
+    def setUp(self):
+        super().setUp()
+        for name in ["a.jpg", "b.JPG", "report.pdf", "song.mp3", "data.xyz", "README", ".bashrc", "notes."]:
+            (self.target / name).write_text(name)
+        (self.target / "folder.jpg").mkdir()
+
+    def _organize(self, **kwargs):
+        with self.assertLogs(level="INFO") as logs:
+            FileOrganizer(self.target).organize_files(**kwargs)
+        return [record.getMessage() for record in logs.records]
+
+    def _tree(self):
+        return sorted(str(path.relative_to(self.target)) for path in self.target.rglob("*"))
+
+    def test_moves_files_and_reports_counts(self):
+        messages = self._organize()
+
+        self.assertEqual(self._tree(), sorted([
+            ".bashrc", "Audio", "Audio/song.mp3", "Documents", "Documents/report.pdf",
+            "Images", "Images/a.jpg", "Images/b.JPG", "Other", "Other/data.xyz",
+            "README", "folder.jpg", "notes.",
+        ]))
+        self.assertIn("Total files moved: 5", messages)
+        self.assertIn("Total files skipped: 3", messages)
+        breakdown = next(message for message in messages if message.startswith("Moved by category: "))
+        # Ties come out in scan order.
+        counts = breakdown.removeprefix("Moved by category: ").split(", ")
+        self.assertEqual(counts[0], "Images: 2")
+        self.assertEqual(sorted(counts[1:]), ["Audio: 1", "Documents: 1", "Other: 1"])
+
+    def test_thread_pool_moves_the_same_files(self):
+        with mock.patch.object(organizer, "MOVE_CHUNK_SIZE", 1):
+            with self.assertLogs(level="INFO") as logs:
+                FileOrganizer(self.target, use_threads=True).organize_files()
+
+        self.assertIn("Images/b.JPG", self._tree())
+        self.assertIn("Total files moved: 5", [record.getMessage() for record in logs.records])
+
+    def test_leaves_downloads_in_progress(self):
+        (self.target / "movie.mp4.part").touch()
+        (self.target / "setup.CRDOWNLOAD").touch()
+
+        messages = self._organize()
+
+        self.assertIn("Total files skipped: 5", messages)
+        self.assertTrue((self.target / "movie.mp4.part").exists())
+        self.assertTrue((self.target / "setup.CRDOWNLOAD").exists())
+
+    def test_in_progress_extensions_are_configurable(self):
+        self.config_path.write_text(
+            '{"file_mappings": {"Images": [".jpg"]}, "in_progress_extensions": [".partial"]}')
+        (self.target / "a.crdownload").touch()
+        (self.target / "b.partial").touch()
+
+        self._organize()
+
+        self.assertTrue((self.target / "Other" / "a.crdownload").exists())
+        self.assertTrue((self.target / "b.partial").exists())
+
+    def test_dry_run_leaves_tree_untouched(self):
+        before = self._tree()
+
+        messages = self._organize(dry_run=True)
+
+        self.assertEqual(self._tree(), before)
+        self.assertIn("Files that would be moved: 5", messages)
+        self.assertIn("Files that would be skipped: 3", messages)
+        self.assertIn("  Would move: b.JPG", messages)
+
+    def test_reports_conflicts_and_failures(self):
+        # A file where the Documents folder should be makes that move fail.
+        (self.target / "Documents").write_text("")
+        move_file = FileOrganizer._move_file
+
+        def fake_move_file(source, destination):
+            if source.endswith(b"a.jpg"):
+                raise FileExistsError(17, "File exists", destination)
+            move_file(source, destination)
+
+        with mock.patch.object(FileOrganizer, "_move_file", staticmethod(fake_move_file)):
+            with self.assertLogs(level="INFO") as logs:
+                FileOrganizer(self.target).organize_files()
+        messages = [record.getMessage() for record in logs.records]
+
+        self.assertIn("1 file(s) already exist in their destination folder and were left in place: a.jpg", messages)
+        failure = next(message for message in messages if message.startswith("Failed to move"))
+        self.assertEqual(failure.splitlines()[0], "Failed to move 1 file(s):")
+        self.assertTrue(failure.splitlines()[1].startswith("  report.pdf: Not a directory: "))
+        self.assertIn("Total files moved: 3", messages)
+        # The 'Documents' file itself has no extension, so 4 + 2 skipped.
+        self.assertIn("Total files skipped: 6", messages)
+        self.assertTrue((self.target / "a.jpg").exists())
+        self.assertTrue((self.target / "report.pdf").exists())
+
+
+class FakeLiburing:
+    """
+    Just enough of liburing 2026.3.30 to drive _move_with_io_uring: str paths
+    only, renames run on submit, and a failed one raises when res is read.
+    """
+
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.submissions = []
+        self.exited = False
+
+    class Ring:
+        def __init__(self):
+            self.queued = []
+            self.completed = []
+
+    class _Sqe:
+        user_data = 0
+        paths = None
+
+    class _Cqe:
+        def __init__(self, user_data, error):
+            self.user_data = user_data
+            self._error = error
+
+        @property
+        def res(self):
+            if self._error is not None:
+                raise self._error
+            return 0
+
+    def Cqe(self):
+        return [None]
+
+    def io_uring_queue_init(self, depth, ring):
+        pass
+
+    def io_uring_get_sqe(self, ring):
+        sqe = self._Sqe()
+        ring.queued.append(sqe)
+        return sqe
+
+    def io_uring_prep_rename(self, sqe, old_path, new_path):
+        if not isinstance(old_path, str) or not isinstance(new_path, str):
+            raise TypeError("Invalid type for argument: oldpath")
+        sqe.paths = (old_path.encode(), new_path.encode())
+
+    def io_uring_submit(self, ring):
+        self.submissions.append(len(ring.queued))
+        for sqe in ring.queued:
+            error = OSError(self.fail_with, os.strerror(self.fail_with)) if self.fail_with else None
+            if error is None:
+                try:
+                    os.rename(*sqe.paths)
+                except OSError as e:
+                    error = OSError(e.errno, e.strerror)
+            ring.completed.append(self._Cqe(sqe.user_data, error))
+        ring.queued.clear()
+
+    def io_uring_wait_cqe(self, ring, completion):
+        completion[0] = ring.completed.pop(0)
+
+    def io_uring_cqe_seen(self, ring, cqe):
+        pass
+
+    def io_uring_queue_exit(self, ring):
+        self.exited = True
+
+
+@unittest.skipUnless(organizer.sys.platform.startswith("linux"), "io_uring is Linux only")
+class IoUringMoveTests(OrganizerTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(10):
+            (self.target / f"photo{i}.jpg").touch()
+        for i in range(3):
+            (self.target / f"doc{i}.pdf").touch()
+
+    def _organize(self, fake):
+        with mock.patch.object(organizer, "liburing", fake), \
+                mock.patch.object(organizer, "IO_URING_QUEUE_DEPTH", 4), \
+                self.assertLogs(level="INFO") as logs:
+            FileOrganizer(self.target, use_io_uring=True).organize_files()
+        self.assertTrue(fake.exited)
+        return [record.getMessage() for record in logs.records]
+
+    def test_batches_each_category(self):
+        fake = FakeLiburing()
+
+        messages = self._organize(fake)
+
+        self.assertEqual(sorted(fake.submissions), [2, 3, 4, 4])
+        self.assertIn("Total files moved: 13", messages)
+        self.assertEqual(len(os.listdir(self.target / "Images")), 10)
+
+    def test_falls_back_without_renameat(self):
+        fake = FakeLiburing(fail_with=organizer.errno.EINVAL)
+
+        messages = self._organize(fake)
+
+        # Only the first batch goes through the ring; it and the rest are
+        # moved with plain renames.
+        self.assertEqual(len(fake.submissions), 1)
+        self.assertIn("Total files moved: 13", messages)
+        self.assertEqual(len(os.listdir(self.target / "Images")), 10)
+
+    def test_renames_names_that_are_not_utf8_directly(self):
+        undecodable = os.fsencode(self.target) + b"/bad\xff.jpg"
+        try:
+            open(undecodable, "wb").close()
+        except OSError:
+            self.skipTest("filesystem rejects names that aren't UTF-8")
+        fake = FakeLiburing()
+
+        messages = self._organize(fake)
+
+        self.assertIn("Total files moved: 14", messages)
+        self.assertTrue(os.path.exists(os.fsencode(self.target) + b"/Images/bad\xff.jpg"))
+
+    def test_requires_liburing(self):
+        with mock.patch.object(organizer, "liburing", None):
+            with self.assertRaises(ValueError):
+                FileOrganizer(self.target, use_io_uring=True)
+
+
+class InotifyParseTests(unittest.TestCase):
+    @staticmethod
+    def _event(mask, name=b"", padded_length=0):
+        name = name.ljust(padded_length, b"\0")
+        return organizer.INOTIFY_EVENT_HEADER.pack(1, mask, 0, len(name)) + name
+
+    def test_splits_events_and_strips_padding(self):
+        data = (self._event(organizer.IN_CLOSE_WRITE, b"photo.jpg", 16)
+                + self._event(organizer.IN_MOVED_TO | organizer.IN_ISDIR, b"folder", 16)
+                + self._event(organizer.IN_IGNORED))
+
+        self.assertEqual(list(FileOrganizer._parse_inotify_events(data)), [
+            (organizer.IN_CLOSE_WRITE, b"photo.jpg"),
+            (organizer.IN_MOVED_TO | organizer.IN_ISDIR, b"folder"),
+            (organizer.IN_IGNORED, b""),
+        ])
+
+    def test_empty_read(self):
+        self.assertEqual(list(FileOrganizer._parse_inotify_events(b"")), [])
+
+
+class CompoundExtensionTests(OrganizerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.file_organizer = FileOrganizer(self.target)
+        self.archives = os.fsencode(self.target / "Archives") + os.fsencode(os.sep)
+
+    def test_compound_extension_ignores_case(self):
+        self.assertEqual(self.file_organizer._destination_for(b"x.TAR.BZ2"),
+                         ("Archives", self.archives + b"x.TAR.BZ2"))
+
+    def test_falls_back_to_last_suffix(self):
+        # Nothing before '.tar.gz' (like '.bashrc'), and a '.gz' that isn't
+        # part of any compound extension: both are filed as '.gz'.
+        self.assertEqual(self.file_organizer._match_compound(b".tar.gz"), None)
+        self.assertEqual(self.file_organizer._destination_for(b".tar.gz"),
+                         ("Archives", self.archives + b".tar.gz"))
+        self.assertEqual(self.file_organizer._destination_for(b"dump.sql.gz"),
+                         ("Archives", self.archives + b"dump.sql.gz"))
+
+    def test_plan_moves_matches_destination_for(self):
+        names = ["x.TAR.BZ2", "backup.tar.gz", ".tar.gz", "dump.sql.gz", "photo.jpg.gz", "photo.jpg"]
+        for name in names:
+            (self.target / name).touch()
+
+        plan, files_skipped = self.file_organizer.plan_moves()
+
+        self.assertEqual(files_skipped, 0)
+        planned = {name: (category, destination)
+                   for category, moves in plan.items()
+                   for name, _, destination in moves}
+        self.assertEqual(planned, {os.fsencode(name): self.file_organizer._destination_for(os.fsencode(name))
+                                   for name in names})
+        self.assertEqual(planned[b"x.TAR.BZ2"][0], "Archives")
+        self.assertEqual(planned[b"photo.jpg"][0], "Images")
+
+
+@unittest.skipIf(organizer._libc is None or not hasattr(organizer._libc, "inotify_init1"),
+                 "watch mode requires Linux inotify")
+class WatchTests(OrganizerTestCase):
+    TIMEOUT = 10
+
+    def _wait_for(self, path):
+        deadline = time.monotonic() + self.TIMEOUT
+        while not path.exists():
+            if time.monotonic() > deadline:
+                self.fail(f"{path} did not appear")
+            time.sleep(0.01)
+
+    def _start_watch(self, file_organizer):
+        thread = threading.Thread(target=file_organizer.watch, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, self.TIMEOUT)
+        return thread
+
+    def _stop_watch(self, thread):
+        # Removing the watched directory ends the watch with IN_IGNORED.
+        shutil.rmtree(self.target)
+        thread.join(self.TIMEOUT)
+        self.assertFalse(thread.is_alive())
+
+    def test_files_new_arrivals(self):
+        (self.target / "old.jpg").touch()
+        file_organizer = FileOrganizer(self.target)
+
+        with self.assertLogs(level="DEBUG") as logs:
+            thread = self._start_watch(file_organizer)
+            # The startup pass runs once the watch is in place.
+            self._wait_for(self.target / "Images" / "old.jpg")
+
+            # A browser writes the download under a temporary name, closes it,
+            # then renames it; only the final name may be moved.
+            (self.target / "file.zip.crdownload").write_text("data")
+            os.rename(self.target / "file.zip.crdownload", self.target / "file.zip")
+            self._wait_for(self.target / "Archives" / "file.zip")
+
+            # A category folder removed while watching is created again.
+            shutil.rmtree(self.target / "Images")
+            (self.target / "new.png").write_text("data")
+            self._wait_for(self.target / "Images" / "new.png")
+
+            (self.target / "README").write_text("data")
+            self._stop_watch(thread)
+
+        messages = [record.getMessage() for record in logs.records]
+        self.assertIn("Waiting for download to finish: file.zip.crdownload", messages)
+        self.assertIn("Moved: file.zip -> Archives/", messages)
+        self.assertIn("Skipping file without extension: README", messages)
+        self.assertFalse([record for record in logs.records if record.levelname == "ERROR"
+                          and not record.getMessage().startswith("Stopped watching")])
+
+    def test_move_errors(self):
+        (self.target / "ready.jpg").touch()
+        file_organizer = FileOrganizer(self.target)
+        move_file = FileOrganizer._move_file
+
+        def fake_move_file(source, destination):
+            if source.endswith(b"gone.jpg"):
+                # Moved by someone else between the event and the move.
+                os.unlink(source)
+                move_file(source, destination)
+            elif source.endswith(b"locked.jpg"):
+                raise PermissionError(13, "Permission denied", source)
+            move_file(source, destination)
+
+        with mock.patch.object(FileOrganizer, "_move_file", staticmethod(fake_move_file)), \
+                self.assertLogs(level="DEBUG") as logs:
+            thread = self._start_watch(file_organizer)
+            self._wait_for(self.target / "Images" / "ready.jpg")
+            for name in ["gone.jpg", "locked.jpg", "last.jpg"]:
+                (self.target / name).write_text("data")
+            self._wait_for(self.target / "Images" / "last.jpg")
+            self._stop_watch(thread)
+
+        messages = [(record.levelname, record.getMessage()) for record in logs.records]
+        self.assertIn(("DEBUG", "Skipping vanished file: gone.jpg"), messages)
+        self.assertIn(("ERROR", f"Failed to move locked.jpg. Error: Permission denied: {self.target}/locked.jpg"),
+                      messages)
+        self.assertIn(("ERROR", f"Stopped watching: {self.target} was removed or unmounted."), messages)
+
+
+if __name__ == "__main__":
+    unittest.main()